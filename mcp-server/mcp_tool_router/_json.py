@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson turns integers wider than 64 bits into floats; a run of 20 digits is
+# the shortest text that can hold one, so such payloads go through json.
+_LONG_INT_BYTES_RE = re.compile(rb"[0-9]{20}")
+_LONG_INT_STR_RE = re.compile(r"[0-9]{20}")
+
+# Built once: json.dumps() constructs a new encoder whenever it gets kwargs.
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_CANONICAL_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), sort_keys=True, ensure_ascii=False
+)
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            # Non-str keys are coerced like json.dumps does, e.g. in YAML init.
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return _encode(value, _COMPACT_ENCODER, separators=(",", ":"))
+
+
+def dumps_canonical(value: Any) -> bytes:
+    """Serialize with sorted keys and compact separators (stable cache keys)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass
+    return _encode(
+        value, _CANONICAL_ENCODER, separators=(",", ":"), sort_keys=True
+    )
+
+
+def dumps_pretty(value: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize with two-space indentation for human-edited config files."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(value, option=option)
+        except TypeError:
+            pass
+    try:
+        return json.dumps(
+            value, indent=2, sort_keys=sort_keys, ensure_ascii=False
+        ).encode("utf-8")
+    except UnicodeEncodeError:
+        return json.dumps(value, indent=2, sort_keys=sort_keys).encode("ascii")
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None and not _has_long_int(data):
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # orjson rejects some input json accepts, e.g. lone surrogate
+            # escapes that Node emits when it truncates a string mid-emoji.
+            pass
+    return json.loads(data)
+
+
+def _has_long_int(data: str | bytes) -> bool:
+    if isinstance(data, str):
+        return _LONG_INT_STR_RE.search(data) is not None
+    return _LONG_INT_BYTES_RE.search(data) is not None
+
+
+def _encode(value: Any, encoder: json.JSONEncoder, **kwargs: Any) -> bytes:
+    # orjson refuses values such as lone surrogates that the stdlib accepts;
+    # those cannot be written as UTF-8, so escape the output to ASCII instead.
+    try:
+        return encoder.encode(value).encode("utf-8")
+    except UnicodeEncodeError:
+        return json.dumps(value, **kwargs).encode("ascii")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import sys
+import threading
 from typing import Any, Iterable
 
 from .mcp_http import HttpMcpClient
@@ -8,6 +10,8 @@ from .mcp_stdio import StdioMcpClient
 from .registry import ServerRegistry, ServerSpec
 from .router import ToolRouter
 
+_MAX_SYNC_WORKERS = 32
+
 
 class ToolRouterHub:
     def __init__(
@@ -22,11 +26,16 @@ class ToolRouterHub:
         self._auto_sync = auto_sync
         self._include_disabled = include_disabled
         self._clients: dict[str, StdioMcpClient | HttpMcpClient] = {}
+        self._clients_lock = threading.Lock()
+        self._client_locks: dict[str, threading.Lock] = {}
         self._synced: set[str] = set()
 
     @classmethod
     def from_yaml(
-        cls, path: str, routerd_path: str | None = None, auto_sync: bool = True
+        cls,
+        path: str,
+        routerd_path: str | list[str] | None = None,
+        auto_sync: bool = True,
     ) -> "ToolRouterHub":
         registry = ServerRegistry.from_yaml(path)
         router = ToolRouter(routerd_path=routerd_path)
@@ -36,7 +45,7 @@ class ToolRouterHub:
     def from_opencode_config(
         cls,
         path: str,
-        routerd_path: str | None = None,
+        routerd_path: str | list[str] | None = None,
         auto_sync: bool = True,
         include_disabled: bool = False,
         ignore_ids: Iterable[str] | None = None,
@@ -63,13 +72,8 @@ class ToolRouterHub:
         return self._registry.list()
 
     def sync_all(self) -> None:
-        servers = (
-            self._registry.list()
-            if self._include_disabled
-            else self._registry.enabled()
-        )
-        for server in servers:
-            self.sync_server(server.id, raise_on_error=False)
+        # A full resync bypasses the clients' short-lived tools/list cache.
+        self._sync_servers(self._sync_candidates(), refresh=True)
 
     def reload_registry(self, registry: ServerRegistry) -> None:
         current_ids = {server.id for server in self._registry.list()}
@@ -77,7 +81,9 @@ class ToolRouterHub:
 
         removed = current_ids - next_ids
         for server_id in removed:
-            client = self._clients.pop(server_id, None)
+            with self._clients_lock:
+                client = self._clients.pop(server_id, None)
+                self._client_locks.pop(server_id, None)
             if client is not None:
                 client.close()
 
@@ -87,21 +93,24 @@ class ToolRouterHub:
         self.sync_all()
 
     def sync_missing(self) -> None:
-        servers = (
-            self._registry.list()
-            if self._include_disabled
-            else self._registry.enabled()
+        self._sync_servers(
+            [
+                server
+                for server in self._sync_candidates()
+                if server.id not in self._synced
+            ]
         )
-        for server in servers:
-            if server.id not in self._synced:
-                self.sync_server(server.id, raise_on_error=False)
 
-    def sync_server(self, server_id: str, *, raise_on_error: bool = True) -> None:
+    def sync_server(
+        self, server_id: str, *, raise_on_error: bool = True, refresh: bool = False
+    ) -> None:
         server = self._require_server(server_id)
         if not server.enabled and not self._include_disabled:
             raise ValueError(f"Server '{server_id}' is disabled.")
         try:
             client = self._ensure_client(server)
+            if refresh:
+                client.refresh_tools()
             self._router.sync_from_mcp(server_id, client)
         except Exception as exc:
             if server.transport == "http" and not raise_on_error:
@@ -149,11 +158,44 @@ class ToolRouterHub:
         return client.tools_call(tool_name, arguments)
 
     def close(self) -> None:
-        for client in self._clients.values():
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._client_locks.clear()
+        for client in clients:
             client.close()
-        self._clients.clear()
         self._router.close()
 
+    def _sync_candidates(self) -> list[ServerSpec]:
+        if self._include_disabled:
+            return self._registry.list()
+        return self._registry.enabled()
+
+    def _sync_servers(
+        self, servers: list[ServerSpec], *, refresh: bool = False
+    ) -> None:
+        if len(servers) <= 1:
+            for server in servers:
+                self.sync_server(server.id, raise_on_error=False, refresh=refresh)
+            return
+        # Syncing is dominated by subprocess startup and the initialize /
+        # tools/list handshake, so run servers concurrently. Errors are
+        # re-raised in registry order once every server has been attempted.
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_SYNC_WORKERS, len(servers))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.sync_server,
+                    server.id,
+                    raise_on_error=False,
+                    refresh=refresh,
+                )
+                for server in servers
+            ]
+        for future in futures:
+            future.result()
+
     def _require_server(self, server_id: str) -> ServerSpec:
         server = self._registry.get(server_id)
         if not server:
@@ -165,36 +207,41 @@ class ToolRouterHub:
         if existing is not None:
             return existing
 
-        client: StdioMcpClient | HttpMcpClient
-        if server.transport == "http":
-            if not server.url:
-                raise ValueError(f"Server '{server.id}' is missing url.")
-            client = HttpMcpClient(server.url, headers=server.headers or None)
-        elif server.transport == "stdio":
-            if not server.cmd:
-                raise ValueError(f"Server '{server.id}' is missing cmd.")
-            client = StdioMcpClient(
-                server.cmd,
-                init_payload=server.init,
-                send_initialized=server.send_initialized,
-                env=server.env,
-            )
-        else:
-            raise ValueError(
-                f"Unsupported transport '{server.transport}' for server '{server.id}'."
-            )
-
-        self._clients[server.id] = client
+        # One lock per server: concurrent callers never spawn duplicate
+        # clients, while different servers can still start in parallel.
+        with self._clients_lock:
+            server_lock = self._client_locks.setdefault(server.id, threading.Lock())
+        with server_lock:
+            existing = self._clients.get(server.id)
+            if existing is not None:
+                return existing
+            client = _create_client(server)
+            self._clients[server.id] = client
         return client
 
 
-def _split_tool_id(tool_id: str) -> tuple[str, str]:
-    if ":" not in tool_id:
-        raise ValueError(
-            f"Invalid toolId '{tool_id}'. Expected '{{serverId}}:{{toolName}}'."
+def _create_client(server: ServerSpec) -> StdioMcpClient | HttpMcpClient:
+    if server.transport == "http":
+        if not server.url:
+            raise ValueError(f"Server '{server.id}' is missing url.")
+        return HttpMcpClient(server.url, headers=server.headers or None)
+    if server.transport == "stdio":
+        if not server.cmd:
+            raise ValueError(f"Server '{server.id}' is missing cmd.")
+        return StdioMcpClient(
+            server.cmd,
+            init_payload=server.init,
+            send_initialized=server.send_initialized,
+            env=server.env,
         )
-    server_id, tool_name = tool_id.split(":", 1)
-    if not server_id or not tool_name:
+    raise ValueError(
+        f"Unsupported transport '{server.transport}' for server '{server.id}'."
+    )
+
+
+def _split_tool_id(tool_id: str) -> tuple[str, str]:
+    server_id, sep, tool_name = tool_id.partition(":")
+    if not sep or not server_id or not tool_name:
         raise ValueError(
             f"Invalid toolId '{tool_id}'. Expected '{{serverId}}:{{toolName}}'."
         )
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
+import itertools
 import json
 import sys
-import threading
+import time
 from typing import Any
 
 import httpx
 
+from ._json import dumps, loads
+
 _INIT_PARAMS = {
     "protocolVersion": "2024-11-05",
     "capabilities": {},
@@ -16,29 +21,73 @@ _INIT_PARAMS = {
 _DEFAULT_CONNECT_TIMEOUT = 10.0
 _DEFAULT_READ_TIMEOUT = 30.0
 _TOOL_CALL_READ_TIMEOUT = 120.0
+_TOOL_CALL_TIMEOUT = httpx.Timeout(
+    _TOOL_CALL_READ_TIMEOUT, connect=_DEFAULT_CONNECT_TIMEOUT
+)
 _MAX_REINIT_RETRIES = 1
+_MAX_BATCH_WORKERS = 32
+_TOOLS_CACHE_TTL = 5.0
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=16, max_connections=32, keepalive_expiry=60.0
+)
+# HTTP/2 lets concurrent JSON-RPC calls share one connection. It needs ``h2``
+# (from ``httpx[http2]``); fall back to HTTP/1.1 keep-alive without it.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 class HttpMcpClient:
     def __init__(self, url: str, headers: dict[str, str] | None = None) -> None:
         self._url = url
-        self._extra_headers = dict(headers) if headers else {}
+        self._base_headers: dict[str, str] = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+            **(headers or {}),
+        }
         self._session_id: str | None = None
-        self._lock = threading.Lock()
-        self._next_id = 1
+        self._cached_headers: dict[str, str] | None = None
+        self._tools_cache: tuple[float, dict] | None = None
+        # count().__next__ is atomic under the GIL; no lock needed for ids.
+        self._next_id = itertools.count(1).__next__
         self._client = httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            limits=_POOL_LIMITS,
             timeout=httpx.Timeout(
                 _DEFAULT_READ_TIMEOUT, connect=_DEFAULT_CONNECT_TIMEOUT
-            )
+            ),
         )
         self._initialize()
 
     def tools_list(self) -> dict:
-        return self._post("tools/list", {})
+        cached = self._tools_cache
+        if cached is not None and time.monotonic() - cached[0] < _TOOLS_CACHE_TTL:
+            return cached[1]
+        tools = self._post("tools/list", {})
+        self._tools_cache = (time.monotonic(), tools)
+        return tools
+
+    def refresh_tools(self) -> dict:
+        """Drop the cached tools/list result and fetch it again."""
+        self._tools_cache = None
+        return self.tools_list()
 
     def tools_call(self, name: str, arguments: dict | None = None) -> dict:
         payload = {"name": name, "arguments": arguments or {}}
-        return self._post("tools/call", payload, read_timeout=_TOOL_CALL_READ_TIMEOUT)
+        return self._post("tools/call", payload, timeout=_TOOL_CALL_TIMEOUT)
+
+    def tools_call_batch(
+        self, calls: list[tuple[str, dict | None]]
+    ) -> list[dict]:
+        """Issue independent tool calls concurrently; results keep call order."""
+        if len(calls) <= 1:
+            return [self.tools_call(name, arguments) for name, arguments in calls]
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_BATCH_WORKERS, len(calls))
+        ) as executor:
+            futures = [
+                executor.submit(self.tools_call, name, arguments)
+                for name, arguments in calls
+            ]
+            return [future.result() for future in futures]
 
     def close(self) -> None:
         self._client.close()
@@ -47,20 +96,13 @@ class HttpMcpClient:
         self._post("initialize", _INIT_PARAMS)
         self._notify("notifications/initialized", {})
 
-    def _reserve_id(self) -> int:
-        with self._lock:
-            request_id = self._next_id
-            self._next_id += 1
-            return request_id
-
     def _build_headers(self) -> dict[str, str]:
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-            **self._extra_headers,
-        }
+        if self._cached_headers is not None:
+            return self._cached_headers
+        headers = self._base_headers
         if self._session_id:
-            headers["Mcp-Session-Id"] = self._session_id
+            headers = {**headers, "Mcp-Session-Id": self._session_id}
+        self._cached_headers = headers
         return headers
 
     def _post(
@@ -68,24 +110,25 @@ class HttpMcpClient:
         method: str,
         params: dict[str, Any],
         *,
-        read_timeout: float | None = None,
+        timeout: httpx.Timeout | None = None,
         _reinit_attempt: int = 0,
     ) -> dict:
-        request_id = self._reserve_id()
+        request_id = self._next_id()
         body = {
             "jsonrpc": "2.0",
             "id": request_id,
             "method": method,
             "params": params,
         }
-        timeout = None
-        if read_timeout is not None:
-            timeout = httpx.Timeout(read_timeout, connect=_DEFAULT_CONNECT_TIMEOUT)
-
+        request = self._client.build_request(
+            "POST",
+            self._url,
+            content=dumps(body),
+            headers=self._build_headers(),
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        )
         try:
-            response = self._client.post(
-                self._url, json=body, headers=self._build_headers(), timeout=timeout
-            )
+            response = self._client.send(request, stream=True)
         except httpx.TimeoutException as exc:
             raise RuntimeError(
                 f"HTTP timeout connecting to {self._url}: {exc}"
@@ -93,34 +136,46 @@ class HttpMcpClient:
         except httpx.HTTPError as exc:
             raise RuntimeError(f"HTTP error connecting to {self._url}: {exc}") from exc
 
-        if (
-            response.status_code == 404
-            and _reinit_attempt < _MAX_REINIT_RETRIES
-            and method != "initialize"
-        ):
-            self._initialize()
-            return self._post(
-                method,
-                params,
-                read_timeout=read_timeout,
-                _reinit_attempt=_reinit_attempt + 1,
-            )
-
-        if response.status_code >= 400:
+        try:
+            if (
+                response.status_code == 404
+                and _reinit_attempt < _MAX_REINIT_RETRIES
+                and method != "initialize"
+            ):
+                response.close()
+                self._initialize()
+                return self._post(
+                    method,
+                    params,
+                    timeout=timeout,
+                    _reinit_attempt=_reinit_attempt + 1,
+                )
+
+            if response.status_code >= 400:
+                response.read()
+                raise RuntimeError(
+                    f"HTTP {response.status_code} from {self._url}: {response.text[:500]}"
+                )
+
+            new_session_id = response.headers.get("mcp-session-id")
+            if new_session_id and new_session_id != self._session_id:
+                self._session_id = new_session_id
+                self._cached_headers = None
+
+            return self._parse_response(response)
+        except httpx.HTTPError as exc:
             raise RuntimeError(
-                f"HTTP {response.status_code} from {self._url}: {response.text[:500]}"
-            )
-
-        new_session_id = response.headers.get("mcp-session-id")
-        if new_session_id:
-            self._session_id = new_session_id
-
-        return self._parse_response(response)
+                f"HTTP error reading response from {self._url}: {exc}"
+            ) from exc
+        finally:
+            response.close()
 
     def _notify(self, method: str, params: dict[str, Any]) -> None:
         body = {"jsonrpc": "2.0", "method": method, "params": params}
         try:
-            self._client.post(self._url, json=body, headers=self._build_headers())
+            self._client.post(
+                self._url, content=dumps(body), headers=self._build_headers()
+            )
         except httpx.HTTPError:
             pass
 
@@ -128,10 +183,10 @@ class HttpMcpClient:
         content_type = response.headers.get("content-type", "")
 
         if "text/event-stream" in content_type:
-            return self._parse_sse(response.text)
+            return self._parse_sse(response)
 
         try:
-            data = response.json()
+            data = loads(response.read())
         except (json.JSONDecodeError, ValueError) as exc:
             raise RuntimeError(f"Invalid JSON from {self._url}: {exc}") from exc
 
@@ -139,13 +194,14 @@ class HttpMcpClient:
             raise RuntimeError(f"JSON-RPC error: {data['error']}")
         return data.get("result", data)
 
-    def _parse_sse(self, text: str) -> dict:
-        for line in text.splitlines():
+    def _parse_sse(self, response: httpx.Response) -> dict:
+        # Stop at the first JSON-RPC message instead of buffering the stream.
+        for line in response.iter_lines():
             if not line.startswith("data: "):
                 continue
             payload = line[6:]
             try:
-                data = json.loads(payload)
+                data = loads(payload)
             except (json.JSONDecodeError, ValueError):
                 continue
             if "error" in data:
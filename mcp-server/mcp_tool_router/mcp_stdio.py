@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
 import os
-import queue
+import re
 import shlex
 import subprocess
 import threading
-from typing import Any
+import time
+from typing import Any, BinaryIO, Callable
+
+from ._json import dumps, loads
 
 
 _DEFAULT_TIMEOUT: float = 120.0
+_READ_CHUNK_SIZE = 65536
+_TOOLS_CACHE_TTL: float = 5.0
+# Finds request ids in lines that are not valid JSON.
+_ID_RE = re.compile(rb'"id"\s*:\s*(\d+)')
 
 
 @dataclass
@@ -21,6 +27,42 @@ class StdioMcpConfig:
     env: dict[str, str] | None = None
 
 
+class _Slot:
+    """Single-use handoff of one response from the reader thread."""
+
+    __slots__ = ("event", "value")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: dict | None = None
+
+    def set(self, value: dict) -> None:
+        self.value = value
+        self.event.set()
+
+
+def _read_lines(
+    stream: BinaryIO, handle_line: Callable[[bytearray], None]
+) -> None:
+    """Feed each newline-delimited message from ``stream`` to ``handle_line``.
+
+    Frames raw read1() chunks instead of iterating lines, which is much
+    cheaper for large replies. Returns at EOF after flushing any partial line.
+    """
+    buffer = bytearray()
+    while True:
+        chunk = stream.read1(_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer += chunk
+        start = 0
+        while (newline := buffer.find(b"\n", start)) >= 0:
+            handle_line(buffer[start:newline])
+            start = newline + 1
+        del buffer[:start]
+    handle_line(buffer)
+
+
 class _StdioJsonRpcClient:
     def __init__(
         self,
@@ -36,12 +78,10 @@ class _StdioJsonRpcClient:
             argv,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            text=True,
-            bufsize=1,
             env=proc_env,
         )
         self._lock = threading.Lock()
-        self._pending: dict[int, queue.Queue[dict]] = {}
+        self._pending: dict[int, _Slot] = {}
         self._next_id = 1
         self._closed = False
         self._reader = threading.Thread(target=self._read_loop, daemon=True)
@@ -80,57 +120,73 @@ class _StdioJsonRpcClient:
             self._reader.join(timeout=1)
 
     def _write_payload(self, payload: dict[str, Any]) -> None:
-        line = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+        line = dumps(payload)
         assert self._proc.stdin is not None
         try:
-            self._proc.stdin.write(line + "\n")
+            self._proc.stdin.write(line + b"\n")
             self._proc.stdin.flush()
         except Exception as exc:
             self._fail_all_pending(f"Failed to write request: {exc}")
             raise
 
-    def _reserve_id(self) -> tuple[int, queue.Queue[dict]]:
+    def _reserve_id(self) -> tuple[int, _Slot]:
+        pending = _Slot()
         with self._lock:
             request_id = self._next_id
             self._next_id += 1
-            pending = queue.Queue(maxsize=1)
             self._pending[request_id] = pending
             return request_id, pending
 
-    def _await_response(self, pending: queue.Queue[dict]) -> dict:
-        try:
-            return pending.get(timeout=self._timeout)
-        except queue.Empty:
+    def _await_response(self, pending: _Slot) -> dict:
+        if not pending.event.wait(self._timeout):
             raise RuntimeError(
                 f"MCP server did not respond within {self._timeout}s"
-            ) from None
+            )
+        assert pending.value is not None
+        return pending.value
 
     def _read_loop(self) -> None:
-        assert self._proc.stdout is not None
-        for raw in self._proc.stdout:
-            line = raw.strip()
-            if not line:
-                continue
-            try:
-                message = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            response_id = message.get("id")
-            if response_id is None:
-                continue
-            with self._lock:
-                pending = self._pending.pop(response_id, None)
-            if pending is not None:
-                pending.put(message)
+        stdout = self._proc.stdout
+        assert stdout is not None
+        _read_lines(stdout, self._handle_line)
         self._closed = True
         self._fail_all_pending("MCP server closed")
 
+    def _handle_line(self, raw: bytes | bytearray) -> None:
+        line = raw.strip()
+        if not line:
+            return
+        try:
+            message = loads(line)
+        except ValueError as exc:
+            self._fail_unparsed(line, exc)
+            return
+        if not isinstance(message, dict):
+            return
+        response_id = message.get("id")
+        if response_id is None:
+            return
+        with self._lock:
+            pending = self._pending.pop(response_id, None)
+        if pending is not None:
+            pending.set(message)
+
+    def _fail_unparsed(self, line: bytes | bytearray, exc: ValueError) -> None:
+        # Nested "id" keys can appear in results, so only fail the request
+        # when exactly one id in the line is still pending.
+        ids = {int(match) for match in _ID_RE.findall(line)}
+        with self._lock:
+            waiting = [request_id for request_id in ids if request_id in self._pending]
+            if len(waiting) != 1:
+                return
+            pending = self._pending.pop(waiting[0])
+        pending.set({"error": {"message": f"Invalid JSON response: {exc}"}})
+
     def _fail_all_pending(self, reason: str) -> None:
         with self._lock:
-            pending = list(self._pending.values())
-            self._pending.clear()
-        for item in pending:
-            item.put({"error": {"message": reason}})
+            pending, self._pending = self._pending, {}
+        for item in pending.values():
+            item.set({"error": {"message": reason}})
 
 
 class StdioMcpClient:
@@ -147,6 +203,7 @@ class StdioMcpClient:
             send_initialized=send_initialized,
             env=env,
         )
+        self._tools_cache: tuple[float, dict] | None = None
         argv = shlex.split(server_cmd)
         self._rpc = _StdioJsonRpcClient(argv, env=env)
         if init_payload is not None:
@@ -155,7 +212,17 @@ class StdioMcpClient:
                 self._rpc.notify("initialized", {})
 
     def tools_list(self) -> dict:
-        return self._rpc.request("tools/list", {})
+        cached = self._tools_cache
+        if cached is not None and time.monotonic() - cached[0] < _TOOLS_CACHE_TTL:
+            return cached[1]
+        tools = self._rpc.request("tools/list", {})
+        self._tools_cache = (time.monotonic(), tools)
+        return tools
+
+    def refresh_tools(self) -> dict:
+        """Drop the cached tools/list result and fetch it again."""
+        self._tools_cache = None
+        return self.tools_list()
 
     def tools_call(self, name: str, arguments: dict | None = None) -> dict:
         payload = {"name": name, "arguments": arguments or {}}
@@ -1,32 +1,50 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import importlib.util
 import json
 import os
+import secrets
 import shutil
+import stat
 import subprocess
+import sys
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from ._json import dumps_pretty, loads
 
 _ROUTER_MODULE = "mcp_tool_router.router_mcp_server"
-_REQUIRED_PACKAGES = ["httpx", "pyyaml"]
-
-_WELL_KNOWN_REMOTE_MCPS: dict[str, dict[str, Any]] = {
-    "context7": {
-        "type": "remote",
-        "url": "https://mcp.context7.com/mcp",
-        "enabled": False,
-    },
-    "grep_app": {
-        "type": "remote",
-        "url": "https://mcp.grep.app",
-        "enabled": False,
-    },
-    "websearch": {
-        "type": "remote",
-        "url": "https://mcp.exa.ai/mcp?tools=web_search_exa",
-        "enabled": False,
-    },
+_REQUIRED_PACKAGES = ["httpx[http2]", "pyyaml"]
+# Modules the router server imports at startup; PyYAML is only loaded lazily.
+_REQUIRED_MODULES = ("httpx",)
+_TEMP_ATTEMPTS = 100
+
+_WELL_KNOWN_REMOTE_MCPS: dict[str, Mapping[str, Any]] = {
+    "context7": MappingProxyType(
+        {
+            "type": "remote",
+            "url": "https://mcp.context7.com/mcp",
+            "enabled": False,
+        }
+    ),
+    "grep_app": MappingProxyType(
+        {
+            "type": "remote",
+            "url": "https://mcp.grep.app",
+            "enabled": False,
+        }
+    ),
+    "websearch": MappingProxyType(
+        {
+            "type": "remote",
+            "url": "https://mcp.exa.ai/mcp?tools=web_search_exa",
+            "enabled": False,
+        }
+    ),
 }
 
 
@@ -36,6 +54,7 @@ def apply_router_config(
     router_command: list[str] | None = None,
     disable_others: bool = True,
     create_backup: bool = True,
+    dry_run: bool = False,
 ) -> dict[str, Any]:
     payload, path = _load_config(config_path)
     mcp = _ensure_mcp(payload)
@@ -46,37 +65,13 @@ def apply_router_config(
     else:
         resolved_cmd, resolved_env = _resolve_router_command()
 
-    router_entry = (
-        dict(mcp.get(router_id, {})) if isinstance(mcp.get(router_id), dict) else {}
+    _merge_router_entry(
+        payload, mcp, router_id, resolved_cmd, resolved_env, disable_others
     )
-    router_entry.update(
-        {
-            "type": "local",
-            "enabled": True,
-            "command": resolved_cmd,
-        }
-    )
-    if resolved_env:
-        environment = (
-            dict(router_entry.get("environment", {}))
-            if isinstance(router_entry.get("environment"), dict)
-            else {}
-        )
-        environment.update(resolved_env)
-        router_entry["environment"] = environment
 
-    mcp[router_id] = router_entry
-
-    for remote_id, remote_entry in _WELL_KNOWN_REMOTE_MCPS.items():
-        if remote_id not in mcp:
-            mcp[remote_id] = dict(remote_entry)
-
-    if disable_others:
-        for server_id, entry in mcp.items():
-            if server_id == router_id:
-                continue
-            if isinstance(entry, dict):
-                entry["enabled"] = False
+    if dry_run:
+        _print_payload(payload)
+        return payload
 
     _write_config(path, payload, create_backup=create_backup)
     _disable_oh_my_opencode_mcps(path.parent, create_backup=create_backup)
@@ -125,90 +120,54 @@ def main() -> int:
     )
 
     args = parser.parse_args()
-
-    payload, path = _load_config(args.config)
-    mcp = _ensure_mcp(payload)
-
-    if args.router_command:
-        resolved_cmd = list(args.router_command)
-        resolved_env: dict[str, str] = {}
-    else:
-        resolved_cmd, resolved_env = _resolve_router_command()
-
-    router_entry = (
-        dict(mcp.get(args.router_id, {}))
-        if isinstance(mcp.get(args.router_id), dict)
-        else {}
+    apply_router_config(
+        args.config,
+        router_id=args.router_id,
+        router_command=args.router_command,
+        disable_others=args.disable_others,
+        create_backup=args.create_backup,
+        dry_run=args.dry_run,
     )
-    router_entry.update(
-        {
-            "type": "local",
-            "enabled": True,
-            "command": resolved_cmd,
-        }
-    )
-    if resolved_env:
-        environment = (
-            dict(router_entry.get("environment", {}))
-            if isinstance(router_entry.get("environment"), dict)
-            else {}
-        )
-        environment.update(resolved_env)
-        router_entry["environment"] = environment
-
-    mcp[args.router_id] = router_entry
-
-    for remote_id, remote_entry in _WELL_KNOWN_REMOTE_MCPS.items():
-        if remote_id not in mcp:
-            mcp[remote_id] = dict(remote_entry)
-
-    if args.disable_others:
-        for server_id, entry in mcp.items():
-            if server_id == args.router_id:
-                continue
-            if isinstance(entry, dict):
-                entry["enabled"] = False
-
-    if args.dry_run:
-        _print_payload(payload)
-        return 0
-
-    _write_config(path, payload, create_backup=args.create_backup)
-    _disable_oh_my_opencode_mcps(path.parent, create_backup=args.create_backup)
     return 0
 
 
-_OH_MY_OPENCODE_BUILTIN_MCPS = ["context7", "grep_app", "websearch"]
+_OH_MY_OPENCODE_BUILTIN_MCPS = ("context7", "grep_app", "websearch")
 
 
 def _disable_oh_my_opencode_mcps(config_dir: Path, *, create_backup: bool) -> None:
     omo_path = config_dir / "oh-my-opencode.json"
 
     omo_payload: dict[str, Any] = {}
-    if omo_path.exists():
-        try:
-            raw = json.loads(omo_path.read_text(encoding="utf-8"))
-            if isinstance(raw, dict):
-                omo_payload = raw
-        except (json.JSONDecodeError, OSError):
-            return
+    try:
+        raw = loads(omo_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, OSError):
+        return
+    else:
+        if isinstance(raw, dict):
+            omo_payload = raw
 
     existing: list[str] = (
         omo_payload.get("disabled_mcps", [])
         if isinstance(omo_payload.get("disabled_mcps"), list)
         else []
     )
-    merged = list(dict.fromkeys(existing + _OH_MY_OPENCODE_BUILTIN_MCPS))
-
-    if merged == existing:
+    already_disabled = set(existing)
+    missing = [
+        mcp_id
+        for mcp_id in _OH_MY_OPENCODE_BUILTIN_MCPS
+        if mcp_id not in already_disabled
+    ]
+    if not missing:
         return
 
-    omo_payload["disabled_mcps"] = merged
-    if create_backup and omo_path.exists():
-        backup = omo_path.with_suffix(omo_path.suffix + ".bak")
-        backup.write_text(omo_path.read_text(encoding="utf-8"), encoding="utf-8")
-    config_dir.mkdir(parents=True, exist_ok=True)
-    omo_path.write_text(json.dumps(omo_payload, indent=2), encoding="utf-8")
+    omo_payload["disabled_mcps"] = existing + missing
+    _write_atomic(
+        omo_path,
+        dumps_pretty(omo_payload),
+        create_backup=create_backup,
+    )
     print(
         f"Disabled oh-my-opencode built-in MCPs ({', '.join(_OH_MY_OPENCODE_BUILTIN_MCPS)})"
         " — now routed through the router."
@@ -216,6 +175,13 @@ def _disable_oh_my_opencode_mcps(config_dir: Path, *, create_backup: bool) -> No
 
 
 def _resolve_router_command() -> tuple[list[str], dict[str, str]]:
+    cmd, env = _probe_router_command()
+    return list(cmd), dict(env)
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_router_command() -> tuple[list[str], dict[str, str]]:
+    """Find a working router command; cached because probes spawn interpreters."""
     default_cmd = ["python3", "-m", _ROUTER_MODULE]
     env: dict[str, str] = {}
     monorepo_root = _find_monorepo_root()
@@ -229,16 +195,18 @@ def _resolve_router_command() -> tuple[list[str], dict[str, str]]:
         if daemon_cli.is_file():
             env["ROUTERD"] = f"node {daemon_cli}"
 
-    # 1. Project .venv python
+    # 1. Project .venv python, then 2. system python3
+    candidates: list[str] = []
     if monorepo_root is not None:
         venv_python = monorepo_root / ".venv" / "bin" / "python3"
-        if venv_python.is_file() and _can_import(str(venv_python), "httpx", env):
-            return [str(venv_python), "-m", _ROUTER_MODULE], env
-
-    # 2. System python3
+        if venv_python.is_file():
+            candidates.append(str(venv_python))
     system_python = _find_python()
-    if system_python is not None and _can_import(system_python, "httpx", env):
-        return [system_python, "-m", _ROUTER_MODULE], env
+    if system_python is not None:
+        candidates.append(system_python)
+    python = _first_importable(candidates, env)
+    if python is not None:
+        return [python, "-m", _ROUTER_MODULE], env
 
     # 3. uv run
     uv = shutil.which("uv")
@@ -252,16 +220,58 @@ def _resolve_router_command() -> tuple[list[str], dict[str, str]]:
     return default_cmd, env
 
 
-def _can_import(python: str, pkg: str, env: dict[str, str]) -> bool:
+def _first_importable(candidates: list[str], env: dict[str, str]) -> str | None:
+    """Return the first candidate that can import the router's dependencies."""
+    if len(candidates) <= 1:
+        results = [_can_import(python, _REQUIRED_MODULES, env) for python in candidates]
+    else:
+        # Each probe is an interpreter startup; run them side by side.
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            results = list(
+                executor.map(
+                    lambda python: _can_import(python, _REQUIRED_MODULES, env),
+                    candidates,
+                )
+            )
+    for python, importable in zip(candidates, results):
+        if importable:
+            return python
+    return None
+
+
+def _can_import(python: str, modules: tuple[str, ...], env: dict[str, str]) -> bool:
+    if _is_current_interpreter(python) and _paths_on_sys_path(env.get("PYTHONPATH")):
+        return all(importlib.util.find_spec(module) is not None for module in modules)
     merged_env = {**os.environ, **env}
     result = subprocess.run(
-        [python, "-c", f"import {pkg}"],
-        capture_output=True,
+        [python, "-c", f"import {', '.join(modules)}"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         env=merged_env,
     )
     return result.returncode == 0
 
 
+def _is_current_interpreter(python: str) -> bool:
+    # Compare unresolved paths: venv interpreters symlink to the base python,
+    # so realpath() would conflate different environments.
+    located = shutil.which(python) or python
+    return os.path.abspath(located) == os.path.abspath(sys.executable)
+
+
+def _paths_on_sys_path(pythonpath: str | None) -> bool:
+    if not pythonpath:
+        return True
+    current = {os.path.abspath(entry) for entry in sys.path if entry}
+    return all(
+        os.path.abspath(entry) in current
+        for entry in pythonpath.split(os.pathsep)
+        if entry
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def _find_monorepo_root() -> Path | None:
     current = Path(__file__).resolve().parent
     for _ in range(8):
@@ -276,6 +286,7 @@ def _find_monorepo_root() -> Path | None:
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _find_python() -> str | None:
     for cmd in ("python3", "python"):
         if shutil.which(cmd) is not None:
@@ -285,33 +296,158 @@ def _find_python() -> str | None:
 
 def _load_config(config_path: str) -> tuple[dict[str, Any], Path]:
     path = Path(os.path.expanduser(config_path))
-    if not path.exists():
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
         return {}, path
-    with path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = loads(data)
     if not isinstance(payload, dict):
         raise ValueError("OpenCode config must be a JSON object.")
     return payload, path
 
 
 def _ensure_mcp(payload: dict[str, Any]) -> dict[str, Any]:
-    if "mcp" not in payload or payload["mcp"] is None:
-        payload["mcp"] = {}
-    if not isinstance(payload["mcp"], dict):
+    if (mcp := payload.get("mcp")) is None:
+        mcp = payload["mcp"] = {}
+    if not isinstance(mcp, dict):
         raise ValueError("OpenCode config 'mcp' field must be an object.")
-    return payload["mcp"]
+    return mcp
+
+
+def _merge_router_entry(
+    payload: dict[str, Any],
+    mcp: dict[str, Any],
+    router_id: str,
+    command: list[str],
+    env: dict[str, str],
+    disable_others: bool,
+) -> None:
+    existing = mcp.get(router_id)
+    router_entry = dict(existing) if isinstance(existing, dict) else {}
+    router_entry.update(
+        {
+            "type": "local",
+            "enabled": True,
+            "command": command,
+        }
+    )
+    if env:
+        current_env = router_entry.get("environment")
+        environment = dict(current_env) if isinstance(current_env, dict) else {}
+        environment.update(env)
+        router_entry["environment"] = environment
+
+    for remote_id, remote_entry in _WELL_KNOWN_REMOTE_MCPS.items():
+        if remote_id not in mcp:
+            # Copied so the payload stays serializable and the template frozen.
+            mcp[remote_id] = dict(remote_entry)
+
+    # router_entry is a copy, so every existing entry can be disabled before
+    # the router entry is (re)inserted. Rebuilding avoids mutating entries
+    # while iterating and leaves the loaded entry dicts untouched; entries
+    # that are already disabled are carried over without a copy.
+    if disable_others:
+        mcp = payload["mcp"] = {
+            server_id: _disabled(entry) for server_id, entry in mcp.items()
+        }
+
+    mcp[router_id] = router_entry
+
+
+def _disabled(entry: Any) -> Any:
+    if isinstance(entry, dict) and entry.get("enabled") is not False:
+        return {**entry, "enabled": False}
+    return entry
 
 
 def _write_config(path: Path, payload: dict[str, Any], create_backup: bool) -> None:
+    _write_atomic(
+        path,
+        dumps_pretty(payload, sort_keys=True),
+        create_backup=create_backup,
+    )
+
+
+def _write_atomic(path: Path, data: bytes, *, create_backup: bool) -> None:
+    """Replace ``path`` via a synced temp file so a crash never truncates it."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    if create_backup and path.exists():
-        backup = path.with_suffix(path.suffix + ".bak")
-        backup.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    # Resolve symlinks so dotfile-managed configs are updated, not replaced.
+    target = Path(os.path.realpath(path))
+    # One stat serves both the backup decision and the mode copy.
+    try:
+        current = target.stat()
+    except FileNotFoundError:
+        current = None
+    if create_backup and current is not None and stat.S_ISREG(current.st_mode):
+        _backup_file(target, path.with_suffix(path.suffix + ".bak"))
+    # A unique, exclusively created temp file: concurrent runs cannot clobber
+    # each other's data and a planted symlink is never written through.
+    fd, tmp = _create_temp(target)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            if current is not None:
+                os.fchmod(handle.fileno(), stat.S_IMODE(current.st_mode))
+            os.fsync(handle.fileno())
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _fsync_dir(target.parent)
+
+
+def _create_temp(target: Path) -> tuple[int, Path]:
+    # Like mkstemp, but with mode 0o666 so the kernel applies the umask and
+    # new configs get the same mode a plain open() would have given them.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0)
+    for _ in range(_TEMP_ATTEMPTS):
+        tmp = target.with_name(f"{target.name}.{secrets.token_hex(8)}.tmp")
+        try:
+            return os.open(tmp, flags, 0o666), tmp
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"Could not create a temporary file next to {target}")
+
+
+def _fsync_dir(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        # Some filesystems do not support syncing directories.
+        pass
+    finally:
+        os.close(fd)
+
+
+def _backup_file(source: Path, backup: Path) -> None:
+    backup.unlink(missing_ok=True)
+    try:
+        # The original inode survives os.replace, so a hard link is a free
+        # backup; fall back to copying where links are unsupported.
+        os.link(source, backup)
+    except OSError:
+        shutil.copyfile(source, backup)
 
 
 def _print_payload(payload: dict[str, Any]) -> None:
-    print(json.dumps(payload, indent=2, sort_keys=True))
+    # Same serializer as _write_config, so the preview matches the file bytes.
+    data = dumps_pretty(payload, sort_keys=True)
+    stdout = sys.stdout
+    out = getattr(stdout, "buffer", None)
+    if out is None:
+        # Text-only streams, e.g. contextlib.redirect_stdout(io.StringIO()).
+        stdout.write(data.decode("utf-8"))
+        stdout.write("\n")
+        return
+    stdout.flush()
+    out.write(data)
+    out.write(b"\n")
+    out.flush()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-import json
 import os
 import shlex
-from typing import Any, Iterable
+import threading
+from typing import Any, Callable, Iterable
 
-import yaml
+from ._json import loads
 
+_REGISTRY_CACHE_SIZE = 16
+_ID_KEYS = ("id", "serverId", "server_id")
+_CMD_KEYS = ("cmd", "command")
+_METADATA_EXCLUDED_KEYS = frozenset(
+    {
+        "id",
+        "serverId",
+        "server_id",
+        "cmd",
+        "command",
+        "init",
+        "send_initialized",
+        "sendInitialized",
+        "initialized",
+        "env",
+        "enabled",
+        "tags",
+        "transport",
+    }
+)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServerSpec:
     id: str
     cmd: str | None = None
@@ -27,14 +48,25 @@ class ServerSpec:
 class ServerRegistry:
     def __init__(self, servers: Iterable[ServerSpec]) -> None:
         self._servers = {server.id: server for server in servers}
+        # Registries are never mutated after construction, so filter once.
+        self._all = tuple(self._servers.values())
+        self._enabled = tuple(server for server in self._all if server.enabled)
 
     @classmethod
     def from_yaml(cls, path: str) -> "ServerRegistry":
         expanded = os.path.expanduser(path)
-        with open(expanded, "r", encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle)
-        servers = _parse_registry_payload(payload)
-        return cls(servers)
+
+        def build() -> "ServerRegistry":
+            # Imported here: PyYAML is only needed for YAML registries.
+            import yaml
+
+            # CSafeLoader is absent when PyYAML is built without libyaml.
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(expanded, "rb") as handle:
+                payload = yaml.load(handle, Loader=loader)
+            return cls(_parse_registry_payload(payload))
+
+        return _cached_registry(expanded, ("yaml", cls), build)
 
     @classmethod
     def from_opencode_config(
@@ -44,25 +76,60 @@ class ServerRegistry:
         ignore_ids: Iterable[str] | None = None,
     ) -> "ServerRegistry":
         expanded = os.path.expanduser(path)
-        with open(expanded, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-        servers = _parse_opencode_payload(
-            payload,
-            include_disabled=include_disabled,
-            ignore_ids=set(ignore_ids or []),
+        ignored = frozenset(ignore_ids or [])
+
+        def build() -> "ServerRegistry":
+            with open(expanded, "rb") as handle:
+                payload = loads(handle.read())
+            servers = _parse_opencode_payload(
+                payload,
+                include_disabled=include_disabled,
+                ignore_ids=set(ignored),
+            )
+            return cls(servers)
+
+        return _cached_registry(
+            expanded, ("opencode", cls, include_disabled, ignored), build
         )
-        return cls(servers)
 
     def list(self) -> list[ServerSpec]:
-        return list(self._servers.values())
+        return list(self._all)
 
     def enabled(self) -> list[ServerSpec]:
-        return [server for server in self._servers.values() if server.enabled]
+        return list(self._enabled)
 
     def get(self, server_id: str) -> ServerSpec | None:
         return self._servers.get(server_id)
 
 
+_registry_cache: OrderedDict[tuple, ServerRegistry] = OrderedDict()
+_registry_cache_lock = threading.Lock()
+
+
+def _cached_registry(
+    path: str, options: tuple, build: Callable[[], ServerRegistry]
+) -> ServerRegistry:
+    """Reuse a parsed registry while the file's mtime and size are unchanged."""
+    stat = os.stat(path)
+    source = (os.path.abspath(path), options)
+    version = (stat.st_mtime_ns, stat.st_size)
+    key = (source, version)
+    with _registry_cache_lock:
+        cached = _registry_cache.get(key)
+        if cached is not None:
+            _registry_cache.move_to_end(key)
+            return cached
+
+    registry = build()
+    with _registry_cache_lock:
+        for stale in [k for k in _registry_cache if k[0] == source]:
+            del _registry_cache[stale]
+        _registry_cache[key] = registry
+        while len(_registry_cache) > _REGISTRY_CACHE_SIZE:
+            _registry_cache.popitem(last=False)
+    return registry
+
+
 def _parse_registry_payload(payload: Any) -> list[ServerSpec]:
     if payload is None:
         return []
@@ -80,8 +147,8 @@ def _parse_registry_payload(payload: Any) -> list[ServerSpec]:
     for entry in servers_payload:
         if not isinstance(entry, dict):
             raise ValueError("Each server entry must be a mapping.")
-        server_id = _string_value(entry, ["id", "serverId", "server_id"])
-        cmd = _string_value(entry, ["cmd", "command"])
+        server_id = _string_value(entry, _ID_KEYS)
+        cmd = _string_value(entry, _CMD_KEYS)
         if not server_id:
             raise ValueError("Each server entry requires 'id'.")
         transport = str(entry.get("transport") or "stdio")
@@ -106,27 +173,12 @@ def _parse_registry_payload(payload: Any) -> list[ServerSpec]:
         metadata = {
             key: value
             for key, value in entry.items()
-            if key
-            not in {
-                "id",
-                "serverId",
-                "server_id",
-                "cmd",
-                "command",
-                "init",
-                "send_initialized",
-                "sendInitialized",
-                "initialized",
-                "env",
-                "enabled",
-                "tags",
-                "transport",
-            }
+            if key not in _METADATA_EXCLUDED_KEYS
         }
         servers.append(
             ServerSpec(
                 id=server_id,
-                cmd=os.path.expandvars(cmd) if cmd else None,
+                cmd=_maybe_expandvars(cmd) if cmd else None,
                 enabled=enabled,
                 init=init_payload if isinstance(init_payload, dict) else None,
                 send_initialized=send_initialized,
@@ -207,11 +259,15 @@ def _parse_opencode_payload(
     return servers
 
 
-def _string_value(entry: dict[str, Any], keys: Iterable[str]) -> str | None:
+def _string_value(entry: dict[str, Any], keys: tuple[str, ...]) -> str | None:
+    get = entry.get
     for key in keys:
-        value = entry.get(key)
-        if isinstance(value, str) and value.strip():
-            return value.strip()
+        value = get(key)
+        # Parsed YAML/JSON yields plain str, so the exact type check suffices.
+        if type(value) is str:
+            stripped = value.strip()
+            if stripped:
+                return stripped
     return None
 
 
@@ -234,15 +290,36 @@ def _string_dict(value: Any) -> dict[str, str]:
 
 
 def _expand_env(value: Any) -> Any:
+    # Most configs have no $VARs; hand those values back without copying.
+    if not _has_dollar(value):
+        return value
+    return _expand_nested(value)
+
+
+def _expand_nested(value: Any) -> Any:
     if isinstance(value, str):
-        return os.path.expandvars(value)
+        return _maybe_expandvars(value)
     if isinstance(value, list):
-        return [_expand_env(item) for item in value]
+        return [_expand_nested(item) for item in value]
     if isinstance(value, dict):
-        return {key: _expand_env(item) for key, item in value.items()}
+        return {key: _expand_nested(item) for key, item in value.items()}
     return value
 
 
+def _maybe_expandvars(value: str) -> str:
+    return os.path.expandvars(value) if "$" in value else value
+
+
+def _has_dollar(value: Any) -> bool:
+    if isinstance(value, str):
+        return "$" in value
+    if isinstance(value, list):
+        return any(_has_dollar(item) for item in value)
+    if isinstance(value, dict):
+        return any(_has_dollar(item) for item in value.values())
+    return False
+
+
 def _command_from_opencode(entry: dict[str, Any]) -> str | None:
     command = entry.get("command")
     args = entry.get("args")
@@ -255,4 +332,4 @@ def _command_from_opencode(entry: dict[str, Any]) -> str | None:
         parts.extend(str(item) for item in args if item)
     if not parts:
         return None
-    return " ".join(shlex.quote(part) for part in parts)
+    return shlex.join(parts)
@@ -1,36 +1,52 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
+import hashlib
 import json
-import queue
 import re
 import shlex
 import subprocess
 import threading
 from typing import Any, Iterable
 
+from ._json import dumps, dumps_canonical, loads
+from .mcp_stdio import _read_lines, _Slot
+
 
 _ROUTERD_TIMEOUT: float = 30.0
+_MAX_SYNC_WORKERS = 8
+_MAX_INFLIGHT = 64
+# Characters that make a routerd command need shell-style splitting.
+_SHELL_SYNTAX_RE = re.compile(r"[\s'\"\\]")
 
 
 @dataclass
 class RouterConfig:
-    routerd_path: str | None = None
+    routerd_path: str | list[str] | None = None
     transport: str = "stdio"
+    max_inflight: int = _MAX_INFLIGHT
 
 
 class _StdioJsonRpcClient:
-    def __init__(self, argv: list[str], timeout: float = _ROUTERD_TIMEOUT) -> None:
+    def __init__(
+        self,
+        argv: list[str],
+        timeout: float = _ROUTERD_TIMEOUT,
+        max_inflight: int = _MAX_INFLIGHT,
+    ) -> None:
         self._timeout = timeout
+        # Bounds outstanding frames so bursts cannot outrun routerd's stdin.
+        self._inflight = threading.BoundedSemaphore(max_inflight)
         self._proc = subprocess.Popen(
             argv,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            text=True,
-            bufsize=1,
         )
         self._lock = threading.Lock()
-        self._pending: dict[int, queue.Queue[dict]] = {}
+        self._write_lock = threading.Lock()
+        self._pending: dict[int, _Slot] = {}
         self._next_id = 1
         self._closed = False
         self._reader = threading.Thread(target=self._read_loop, daemon=True)
@@ -39,22 +55,34 @@ class _StdioJsonRpcClient:
     def request(self, method: str, params: dict | None = None) -> Any:
         if self._closed:
             raise RuntimeError("JSON-RPC client is closed")
-        request_id, pending = self._reserve_id()
-        payload: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "method": method}
-        if params is not None:
-            payload["params"] = params
-        line = json.dumps(payload, separators=(",", ":"), sort_keys=True)
-        assert self._proc.stdin is not None
+        self._acquire_inflight()
         try:
-            self._proc.stdin.write(line + "\n")
-            self._proc.stdin.flush()
-        except Exception as exc:
-            self._fail_all_pending(f"Failed to write request: {exc}")
-            raise
-        response = self._await_response(pending)
-        if "error" in response:
-            raise RuntimeError(f"JSON-RPC error: {response['error']}")
-        return response.get("result")
+            [(request_id, pending)] = self._reserve_ids(1)
+            payload = _request_payload(request_id, method, params)
+            self._write_line(dumps(payload))
+            response = self._await_response(pending)
+        finally:
+            self._inflight.release()
+        return _response_result(response)
+
+    def request_batch(self, calls: list[tuple[str, dict | None]]) -> list[Any]:
+        """Send requests as one JSON-RPC batch; results keep call order."""
+        if not calls:
+            return []
+        if self._closed:
+            raise RuntimeError("JSON-RPC client is closed")
+        self._acquire_inflight()
+        try:
+            reserved = self._reserve_ids(len(calls))
+            batch = [
+                _request_payload(request_id, method, params)
+                for (request_id, _), (method, params) in zip(reserved, calls)
+            ]
+            self._write_line(dumps(batch))
+            responses = [self._await_response(pending) for _, pending in reserved]
+        finally:
+            self._inflight.release()
+        return [_response_result(response) for response in responses]
 
     def close(self) -> None:
         if self._closed:
@@ -67,70 +95,142 @@ class _StdioJsonRpcClient:
             self._proc.terminate()
             self._reader.join(timeout=1)
 
-    def _reserve_id(self) -> tuple[int, queue.Queue[dict]]:
-        with self._lock:
-            request_id = self._next_id
-            self._next_id += 1
-            pending = queue.Queue(maxsize=1)
-            self._pending[request_id] = pending
-            return request_id, pending
+    def _acquire_inflight(self) -> None:
+        if not self._inflight.acquire(timeout=self._timeout):
+            raise RuntimeError(
+                f"routerd had too many requests in flight for {self._timeout}s"
+            )
 
-    def _await_response(self, pending: queue.Queue[dict]) -> dict:
+    def _reserve_ids(self, count: int) -> list[tuple[int, _Slot]]:
+        slots = [_Slot() for _ in range(count)]
+        reserved: list[tuple[int, _Slot]] = []
+        with self._lock:
+            for pending in slots:
+                request_id = self._next_id
+                self._next_id += 1
+                self._pending[request_id] = pending
+                reserved.append((request_id, pending))
+        return reserved
+
+    def _write_line(self, line: bytes) -> None:
+        assert self._proc.stdin is not None
         try:
-            return pending.get(timeout=self._timeout)
-        except queue.Empty:
-            raise RuntimeError(
-                f"routerd did not respond within {self._timeout}s"
-            ) from None
+            with self._write_lock:
+                # Two writes under the lock instead of copying line + b"\n".
+                self._proc.stdin.write(line)
+                self._proc.stdin.write(b"\n")
+                self._proc.stdin.flush()
+        except Exception as exc:
+            self._fail_all_pending(f"Failed to write request: {exc}")
+            raise
+
+    def _await_response(self, pending: _Slot) -> dict:
+        if not pending.event.wait(self._timeout):
+            raise RuntimeError(f"routerd did not respond within {self._timeout}s")
+        assert pending.value is not None
+        return pending.value
 
     def _read_loop(self) -> None:
-        assert self._proc.stdout is not None
-        for raw in self._proc.stdout:
-            line = raw.strip()
-            if not line:
-                continue
-            try:
-                message = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            response_id = message.get("id")
-            if response_id is None:
-                continue
-            with self._lock:
-                pending = self._pending.pop(response_id, None)
-            if pending is not None:
-                pending.put(message)
+        stdout = self._proc.stdout
+        assert stdout is not None
+        _read_lines(stdout, self._handle_line)
         self._closed = True
         self._fail_all_pending("routerd closed")
 
+    def _handle_line(self, raw: bytes | bytearray) -> None:
+        line = raw.strip()
+        if not line:
+            return
+        try:
+            message = loads(line)
+        except ValueError:
+            return
+        # Batch requests are answered with a top-level array.
+        if isinstance(message, list):
+            for item in message:
+                self._deliver(item)
+        else:
+            self._deliver(message)
+
+    def _deliver(self, message: Any) -> None:
+        if not isinstance(message, dict):
+            return
+        response_id = message.get("id")
+        if response_id is None:
+            return
+        with self._lock:
+            pending = self._pending.pop(response_id, None)
+        if pending is not None:
+            pending.set(message)
+
     def _fail_all_pending(self, reason: str) -> None:
         with self._lock:
-            pending = list(self._pending.values())
-            self._pending.clear()
-        for item in pending:
-            item.put({"error": {"message": reason}})
+            pending, self._pending = self._pending, {}
+        for item in pending.values():
+            item.set({"error": {"message": reason}})
+
+
+def _request_payload(
+    request_id: int, method: str, params: dict | None
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        payload["params"] = params
+    return payload
+
+
+def _response_result(response: dict) -> Any:
+    if "error" in response:
+        raise RuntimeError(f"JSON-RPC error: {response['error']}")
+    return response.get("result")
 
 
 class ToolRouter:
     def __init__(
-        self, routerd_path: str | None = None, transport: str = "stdio"
+        self,
+        routerd_path: str | list[str] | None = None,
+        transport: str = "stdio",
+        max_inflight: int = _MAX_INFLIGHT,
     ) -> None:
-        self._config = RouterConfig(routerd_path=routerd_path, transport=transport)
+        self._config = RouterConfig(
+            routerd_path=routerd_path, transport=transport, max_inflight=max_inflight
+        )
         self._client: _StdioJsonRpcClient | None = None
+        self._client_lock = threading.Lock()
         self._raw_tool_cache: dict[str, dict[str, Any]] = {}
         self._tool_cache: dict[str, dict[str, Any]] = {}
+        self._schema_cache: dict[str, dict[str, Any]] = {}
+        # server_id -> canonical tool JSON -> card built from it last sync.
+        self._card_cache: dict[str, dict[bytes, dict[str, Any]]] = {}
+        self._catalog_version = 0
+        # server_id -> digest of the tools/list last upserted into routerd.
+        self._tool_signatures: dict[str, bytes] = {}
+        # Held across signature check, upsert and record, and by resets, so
+        # a reset can never land between an upsert and its recorded signature.
+        self._sync_lock = threading.Lock()
 
     def _rpc(self) -> _StdioJsonRpcClient:
         if self._config.transport != "stdio":
             raise ValueError(f"Unsupported transport: {self._config.transport}")
-        if self._client is None:
-            argv = self._routerd_argv()
-            self._client = _StdioJsonRpcClient(argv)
-        return self._client
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = _StdioJsonRpcClient(
+                        self._routerd_argv(), max_inflight=self._config.max_inflight
+                    )
+                    self._client = client
+        return client
 
     def _routerd_argv(self) -> list[str]:
-        if self._config.routerd_path:
-            return shlex.split(self._config.routerd_path)
+        path = self._config.routerd_path
+        if isinstance(path, list):
+            return list(path)
+        if path:
+            if _SHELL_SYNTAX_RE.search(path) is None:
+                return [path]
+            return shlex.split(path)
         return ["tool-routerd"]
 
     def sync_from_mcp(self, server_id: str, mcp_client: Any) -> None:
@@ -141,36 +241,110 @@ class ToolRouter:
         - convert to ToolCard
         - catalog.upsertTools
         """
-        tools = mcp_client.tools_list()
-        if isinstance(tools, dict):
-            tools = tools.get("tools", [])
+        self.sync_from_mcp_many([(server_id, mcp_client)])
+
+    def sync_from_mcp_many(self, pairs: Iterable[tuple[str, Any]]) -> None:
+        """Sync several servers: fetch tools/list concurrently, upsert once."""
+        pairs = list(pairs)
+        if len(pairs) <= 1:
+            fetched = [_list_tools(client) for _, client in pairs]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_SYNC_WORKERS, len(pairs))
+            ) as executor:
+                fetched = list(
+                    executor.map(lambda pair: _list_tools(pair[1]), pairs)
+                )
+
+        # Each tool is serialized once; the bytes feed both the server
+        # signature and the per-tool card cache.
+        encoded = [_encode_tools(tools) for tools in fetched]
+        signatures = [_tools_signature(tool_bytes) for tool_bytes in encoded]
+        with self._sync_lock:
+            tool_cards: list[dict[str, Any]] = []
+            changed: dict[str, bytes | None] = {}
+            for (server_id, _), tools, tool_bytes, signature in zip(
+                pairs, fetched, encoded, signatures
+            ):
+                if (
+                    signature is not None
+                    and self._tool_signatures.get(server_id) == signature
+                ):
+                    continue
+                changed[server_id] = signature
+                tool_cards.extend(
+                    self._cache_tool_cards(server_id, tools, tool_bytes)
+                )
+            if not changed:
+                return
+            self._catalog_version += 1
+            tool_cards.sort(key=lambda item: item["toolId"])
+            self._rpc().request("catalog.upsertTools", {"tools": tool_cards})
+            for server_id, signature in changed.items():
+                if signature is not None:
+                    self._tool_signatures[server_id] = signature
+
+    def _cache_tool_cards(
+        self, server_id: str, tools: list[Any], tool_bytes: list[bytes | None]
+    ) -> list[dict[str, Any]]:
+        previous = self._card_cache.get(server_id, {})
+        # Rebuilt every sync so the cache only holds the current listing.
+        cards_by_json: dict[bytes, dict[str, Any]] = {}
         tool_cards: list[dict[str, Any]] = []
-        for tool in tools or []:
+        for tool, tool_json in zip(tools, tool_bytes):
             if not isinstance(tool, dict):
                 continue
-            card = _toolcard_from_mcp(server_id, tool)
+            card = previous.get(tool_json) if tool_json is not None else None
+            if card is None:
+                card = _toolcard_from_mcp(server_id, tool)
+            if tool_json is not None:
+                cards_by_json[tool_json] = card
             if not card:
                 continue
             tool_id = card["toolId"]
-            raw_tool = dict(tool)
-            if "name" not in raw_tool:
-                raw_tool["name"] = card["toolName"]
+            # Cached entries are treated as read-only, so the listing dict can
+            # be shared; copy only when the name has to be filled in.
+            if "name" in tool:
+                raw_tool = tool
+            else:
+                raw_tool = {**tool, "name": card["toolName"]}
             self._raw_tool_cache[tool_id] = raw_tool
             self._tool_cache[tool_id] = card
+            self._schema_cache.pop(tool_id, None)
             tool_cards.append(card)
-        tool_cards.sort(key=lambda item: item["toolId"])
-        self._rpc().request("catalog.upsertTools", {"tools": tool_cards})
+        self._card_cache[server_id] = cards_by_json
+        return tool_cards
+
+    @property
+    def catalog_version(self) -> int:
+        """Counter bumped whenever cached tool cards may have changed."""
+        return self._catalog_version
 
     def get_tool_card(self, tool_id: str) -> dict[str, Any] | None:
+        """Return the cached card; it is shared and must not be mutated."""
         return self._tool_cache.get(tool_id)
 
     def get_tool_cards(self, tool_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Return cached cards in order; they are shared and must not be mutated."""
         return [
             self._tool_cache[tool_id]
             for tool_id in tool_ids
             if tool_id in self._tool_cache
         ]
 
+    def get_fallback_schema(self, tool_id: str) -> dict[str, Any] | None:
+        """Return an inputSchema rebuilt from the card's args, memoized per tool.
+
+        The returned schema is shared between callers and must not be mutated.
+        """
+        schema = self._schema_cache.get(tool_id)
+        if schema is None:
+            card = self._tool_cache.get(tool_id)
+            if card is None:
+                return None
+            schema = self._schema_cache[tool_id] = _schema_from_card(card)
+        return schema
+
     def get_raw_tool(self, tool_id: str) -> dict[str, Any] | None:
         return self._raw_tool_cache.get(tool_id)
 
@@ -204,6 +378,34 @@ class ToolRouter:
         """Mark a tool as used for working-set recency tracking."""
         self._rpc().request("ws.markUsed", {"sessionId": session_id, "toolId": tool_id})
 
+    def mark_tools_used_batch(self, session_id: str, tool_ids: Iterable[str]) -> None:
+        """Mark several tools as used with a single routerd round trip."""
+        self._rpc().request_batch(
+            [
+                ("ws.markUsed", {"sessionId": session_id, "toolId": tool_id})
+                for tool_id in tool_ids
+            ]
+        )
+
+    def post_call(
+        self,
+        session_id: str | None,
+        tool_id: str,
+        raw_result: dict,
+        reduce: bool = False,
+    ) -> dict | None:
+        """Record tool usage and optionally reduce its result in one round trip."""
+        calls: list[tuple[str, dict | None]] = []
+        if session_id:
+            calls.append(("ws.markUsed", {"sessionId": session_id, "toolId": tool_id}))
+        if reduce:
+            params = {"rawResult": raw_result, "toolId": tool_id}
+            calls.append(("result.reduce", params))
+        results = self._rpc().request_batch(calls)
+        if not reduce:
+            return None
+        return results[-1] or {}
+
     def reduce_result(self, tool_id: str | None, raw_result: dict) -> dict:
         """Reduce a tool call result to a compact, deterministic form."""
         params: dict[str, Any] = {"rawResult": raw_result}
@@ -213,17 +415,91 @@ class ToolRouter:
         return result or {}
 
     def reset_catalog(self) -> None:
-        self._rpc().request("catalog.reset", {})
+        with self._sync_lock:
+            self._rpc().request("catalog.reset", {})
+            self._tool_signatures.clear()
+            self._catalog_version += 1
 
     def close(self) -> None:
         """Release any daemon resources."""
-        if self._client is None:
-            return None
-        self._client.close()
-        self._client = None
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            # Closing first fails any in-flight upsert, releasing the sync lock.
+            client.close()
+        with self._sync_lock:
+            # A new routerd starts with an empty catalog.
+            self._tool_signatures.clear()
         return None
 
 
+def _schema_from_card(card: dict[str, Any]) -> dict[str, Any]:
+    props: dict[str, Any] = {}
+    required: list[str] = []
+    for arg in card.get("args", []):
+        if not isinstance(arg, dict):
+            continue
+        name = arg.get("name")
+        if not name:
+            continue
+        prop: dict[str, Any] = {}
+        if "description" in arg:
+            prop["description"] = arg["description"]
+        type_hint = arg.get("typeHint")
+        if isinstance(type_hint, str):
+            base_type = type_hint.split(":", 1)[0]
+            if base_type in {
+                "string",
+                "number",
+                "integer",
+                "boolean",
+                "object",
+                "array",
+            }:
+                prop["type"] = base_type
+            else:
+                prop["type"] = "string"
+        else:
+            prop["type"] = "string"
+        if "example" in arg:
+            prop["example"] = arg["example"]
+        props[str(name)] = prop
+        if arg.get("required"):
+            required.append(str(name))
+    schema: dict[str, Any] = {"type": "object", "properties": props}
+    if required:
+        schema["required"] = required
+    return schema
+
+
+def _list_tools(mcp_client: Any) -> list[Any]:
+    tools = mcp_client.tools_list()
+    if isinstance(tools, dict):
+        tools = tools.get("tools", [])
+    return tools or []
+
+
+def _encode_tools(tools: list[Any]) -> list[bytes | None]:
+    encoded: list[bytes | None] = []
+    for tool in tools:
+        try:
+            encoded.append(dumps_canonical(tool))
+        except (TypeError, ValueError):
+            encoded.append(None)
+    return encoded
+
+
+def _tools_signature(tool_bytes: list[bytes | None]) -> bytes | None:
+    if None in tool_bytes:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    for tool_json in tool_bytes:
+        # Canonical JSON never contains a raw newline, so it separates items.
+        digest.update(tool_json)
+        digest.update(b"\n")
+    return digest.digest()
+
+
 def _toolcard_from_mcp(server_id: str, tool: dict[str, Any]) -> dict[str, Any]:
     tool_name = tool.get("name") or tool.get("toolName")
     if not tool_name:
@@ -294,51 +570,63 @@ def _string_list(value: Any) -> list[str]:
     return [str(value)]
 
 
-_DERIVED_STOPWORDS = {
-    "a",
-    "an",
-    "and",
-    "by",
-    "for",
-    "from",
-    "in",
-    "into",
-    "of",
-    "on",
-    "or",
-    "per",
-    "the",
-    "to",
-    "via",
-    "with",
-}
+_DERIVED_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "by",
+        "for",
+        "from",
+        "in",
+        "into",
+        "of",
+        "on",
+        "or",
+        "per",
+        "the",
+        "to",
+        "via",
+        "with",
+    }
+)
+
+
+_SEPARATOR_RE = re.compile(r"[_-]+")
+# camelCase, letter->digit and digit->letter boundaries in a single pass.
+_WORD_BOUNDARY_RE = re.compile(
+    r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Za-z])(?=[0-9])|(?<=[0-9])(?=[A-Za-z])"
+)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# One match per normalized word of ASCII text: an uppercase run may carry
+# trailing lowercase letters ("HTTPServer"), digits always stand alone.
+_ASCII_WORD_RE = re.compile(r"[A-Z]+[a-z]*|[a-z]+|[0-9]+")
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_text(value: str) -> str:
     if not value:
         return ""
-    normalized = re.sub(r"[_-]+", " ", value)
-    normalized = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", normalized)
-    normalized = re.sub(r"([A-Za-z])([0-9])", r"\1 \2", normalized)
-    normalized = re.sub(r"([0-9])([A-Za-z])", r"\1 \2", normalized)
+    normalized = _SEPARATOR_RE.sub(" ", value)
+    normalized = _WORD_BOUNDARY_RE.sub(" ", normalized)
     normalized = normalized.lower()
-    normalized = re.sub(r"[^a-z0-9]+", " ", normalized)
+    normalized = _NON_ALNUM_RE.sub(" ", normalized)
     return normalized.strip()
 
 
 def _tokenize_keywords(*parts: Any) -> list[str]:
     text = " ".join(str(part) for part in parts if part)
-    normalized = _normalize_text(text)
-    if not normalized:
-        return []
-    tokens: list[str] = []
-    for token in normalized.split():
-        if len(token) < 2:
-            continue
-        if token in _DERIVED_STOPWORDS:
-            continue
-        tokens.append(token)
-    return tokens
+    if text.isascii():
+        words = [word.lower() for word in _ASCII_WORD_RE.findall(text)]
+    else:
+        # Unicode lowercasing can yield ASCII letters (e.g. the Kelvin sign),
+        # so non-ASCII text keeps the regex normalization path.
+        words = _normalize_text(text).split()
+    return [
+        token
+        for token in words
+        if len(token) >= 2 and token not in _DERIVED_STOPWORDS
+    ]
 
 
 def _derive_tags(tool_name: str, title: Any, description: Any) -> list[str]:
@@ -366,55 +654,52 @@ def _args_from_schema(schema: dict[str, Any]) -> list[dict[str, Any]]:
     properties = schema.get("properties") or {}
     if not isinstance(properties, dict):
         return []
-    required = schema.get("required") or []
-    if not isinstance(required, list):
-        required = []
+    required_list = schema.get("required") or []
+    if not isinstance(required_list, list):
+        required_list = []
+    required = {item for item in required_list if isinstance(item, str)}
     args: list[dict[str, Any]] = []
     for name in sorted(properties.keys()):
-        prop = properties.get(name) or {}
-        if not isinstance(prop, dict):
-            prop = {}
+        prop = properties.get(name)
         arg: dict[str, Any] = {"name": name}
-        desc = prop.get("description")
+        if not prop or not isinstance(prop, dict):
+            # Nothing to describe beyond the name and whether it is required.
+            if name in required:
+                arg["required"] = True
+            args.append(arg)
+            continue
+        get = prop.get
+        desc = get("description")
         if desc:
             arg["description"] = str(desc)
-        type_hint = _type_hint(prop)
+        schema_type = get("type")
+        if isinstance(schema_type, str):
+            schema_format = get("format")
+            type_hint = (
+                f"{schema_type}:{schema_format}" if schema_format else schema_type
+            )
+        elif isinstance(schema_type, list):
+            type_hint = "|".join(str(item) for item in schema_type)
+        elif "anyOf" in prop or "oneOf" in prop:
+            type_hint = "any"
+        else:
+            type_hint = None
         if type_hint:
             arg["typeHint"] = type_hint
         if name in required:
             arg["required"] = True
-        example = _example_value(prop)
-        if example is not None:
-            arg["example"] = example
+        if "example" in prop:
+            arg["example"] = _stringify_example(prop["example"])
+        else:
+            examples = get("examples")
+            if isinstance(examples, list) and examples:
+                arg["example"] = _stringify_example(examples[0])
+            elif "default" in prop:
+                arg["example"] = _stringify_example(prop["default"])
         args.append(arg)
     return args
 
 
-def _type_hint(schema: dict[str, Any]) -> str | None:
-    schema_type = schema.get("type")
-    if isinstance(schema_type, list):
-        return "|".join(str(item) for item in schema_type)
-    if isinstance(schema_type, str):
-        schema_format = schema.get("format")
-        if schema_format:
-            return f"{schema_type}:{schema_format}"
-        return schema_type
-    if "anyOf" in schema or "oneOf" in schema:
-        return "any"
-    return None
-
-
-def _example_value(schema: dict[str, Any]) -> str | None:
-    if "example" in schema:
-        return _stringify_example(schema["example"])
-    examples = schema.get("examples")
-    if isinstance(examples, list) and examples:
-        return _stringify_example(examples[0])
-    if "default" in schema:
-        return _stringify_example(schema["default"])
-    return None
-
-
 def _stringify_example(value: Any) -> str:
     if isinstance(value, str):
         return value
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shutil
@@ -8,6 +9,7 @@ import threading
 import time
 from typing import Any, Iterable
 
+from ._json import dumps, loads
 from .hub import ToolRouterHub
 
 PROTOCOL_VERSION = "2024-11-05"
@@ -17,6 +19,8 @@ SERVER_VERSION = "0.1.0"
 DEFAULT_TOP_K = 20
 DEFAULT_BUDGET_TOKENS = 1500
 
+_TOOL_INFO_CACHE_SIZE = 256
+
 
 class RpcError(Exception):
     def __init__(self, code: int, message: str) -> None:
@@ -33,6 +37,13 @@ class RouterMcpServer:
     ) -> None:
         self._hub = hub
         self._default_session = default_session
+
+        @functools.lru_cache(maxsize=_TOOL_INFO_CACHE_SIZE)
+        def tool_info_cached(tool_id: str, catalog_version: int) -> dict[str, Any]:
+            # catalog_version is only part of the key: a sync invalidates entries.
+            return self._build_tool_info(tool_id)
+
+        self._tool_info_cached = tool_info_cached
         self._tools = [
             {
                 "name": "router_select_tools",
@@ -118,13 +129,13 @@ class RouterMcpServer:
         ]
 
     def serve(self) -> None:
-        for raw in sys.stdin:
+        for raw in sys.stdin.buffer:
             line = raw.strip()
             if not line:
                 continue
             try:
-                message = json.loads(line)
-            except json.JSONDecodeError:
+                message = loads(line)
+            except ValueError:
                 continue
             if "id" not in message:
                 self._handle_notification(message)
@@ -220,11 +231,11 @@ class RouterMcpServer:
         result = self._hub.call_tool(tool_id, payload)
 
         session_id = arguments.get("sessionId") or self._default_session
-        if session_id:
-            self._hub.router.mark_tool_used(str(session_id), tool_id)
-
-        if bool(arguments.get("reduce")):
-            reduced = self._hub.router.reduce_result(tool_id, result)
+        reduce = bool(arguments.get("reduce"))
+        reduced = self._hub.router.post_call(
+            str(session_id) if session_id else None, tool_id, result, reduce=reduce
+        )
+        if reduce:
             return {"toolId": tool_id, "rawResult": result, "reduced": reduced}
         return result
 
@@ -232,6 +243,9 @@ class RouterMcpServer:
         tool_id = str(arguments.get("toolId") or arguments.get("tool_id") or "").strip()
         if not tool_id:
             raise RpcError(-32602, "router_tool_info requires 'toolId'.")
+        return self._tool_info_cached(tool_id, self._hub.router.catalog_version)
+
+    def _build_tool_info(self, tool_id: str) -> dict[str, Any]:
         router = self._hub.router
         card = router.get_tool_card(tool_id)
         raw = router.get_raw_tool(tool_id)
@@ -259,7 +273,7 @@ class RouterMcpServer:
                 if "input_schema" in tool:
                     tool["inputSchema"] = tool["input_schema"]
                 elif card:
-                    tool["inputSchema"] = _schema_from_card(card)
+                    tool["inputSchema"] = router.get_fallback_schema(tool_id)
             tool["toolId"] = tool_id
             tool["serverId"] = card.get("serverId") or tool_id.split(":", 1)[0]
             tool["toolName"] = card.get("toolName") or tool.get("name")
@@ -267,9 +281,13 @@ class RouterMcpServer:
         return tools
 
     def _write_response(self, payload: dict[str, Any]) -> None:
-        line = json.dumps(payload, separators=(",", ":"), sort_keys=True)
-        sys.stdout.write(line + "\n")
-        sys.stdout.flush()
+        # Bytes straight to the buffer: no text-layer encode, and non-ASCII
+        # output does not depend on the locale's stdout encoding. The newline
+        # is a separate write so large responses are not copied to append it.
+        out = sys.stdout.buffer
+        out.write(dumps(payload))
+        out.write(b"\n")
+        out.flush()
 
 
 def _wrap_content(payload: Any) -> dict[str, Any]:
@@ -279,45 +297,6 @@ def _wrap_content(payload: Any) -> dict[str, Any]:
     return {"content": [{"type": "text", "text": text}]}
 
 
-def _schema_from_card(card: dict[str, Any]) -> dict[str, Any]:
-    props: dict[str, Any] = {}
-    required: list[str] = []
-    for arg in card.get("args", []):
-        if not isinstance(arg, dict):
-            continue
-        name = arg.get("name")
-        if not name:
-            continue
-        prop: dict[str, Any] = {}
-        if "description" in arg:
-            prop["description"] = arg["description"]
-        type_hint = arg.get("typeHint")
-        if isinstance(type_hint, str):
-            base_type = type_hint.split(":", 1)[0]
-            if base_type in {
-                "string",
-                "number",
-                "integer",
-                "boolean",
-                "object",
-                "array",
-            }:
-                prop["type"] = base_type
-            else:
-                prop["type"] = "string"
-        else:
-            prop["type"] = "string"
-        if "example" in arg:
-            prop["example"] = arg["example"]
-        props[str(name)] = prop
-        if arg.get("required"):
-            required.append(str(name))
-    schema: dict[str, Any] = {"type": "object", "properties": props}
-    if required:
-        schema["required"] = required
-    return schema
-
-
 def _coerce_int(value: Any, default: int) -> int:
     try:
         if value is None: